@@ -1,7 +1,8 @@
 import os
 import json
 import hashlib
-from datetime import datetime, timedelta
+import hmac
+from datetime import datetime
 from pathlib import Path
 from kivy.app import App
 from kivy.uix.screenmanager import ScreenManager, Screen
@@ -12,13 +13,18 @@ from kivy.uix.spinner import Spinner
 from kivy.uix.popup import Popup
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
 from kivy.properties import ListProperty
 from kivy.clock import Clock
 from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.platypus import BaseDocTemplate, Frame, PageTemplate, Paragraph
 from android.permissions import request_permissions, Permission  # type: ignore
 import asyncio
+import operator
 import platform
+import time
 
 # File storage setup
 BASE_DIR = Path(os.path.expanduser("~/.fieldtests"))
@@ -32,16 +38,62 @@ GENERAL_INFO_FILE = BASE_DIR / "general_info.json"
 for d in [BASE_DIR, CURVES_DIR, FORMS_DIR, ARCHIVED_CURVES_DIR, ARCHIVED_FORMS_DIR]:
     d.mkdir(parents=True, exist_ok=True)
 
-# Passcodes (hashed for security)
-ADMIN_PASSCODE_HASH = hashlib.sha256("1984".encode()).hexdigest()
-MASTER_PASSCODE_HASH = hashlib.sha256("1776".encode()).hexdigest()
+# Fast JSON codec when available (orjson, then ujson, then stdlib)
+try:
+    import orjson
+
+    json_loads = orjson.loads
+
+    def json_dumps(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:
+    try:
+        import ujson
+
+        json_loads = ujson.loads
+        json_dumps = ujson.dumps
+    except ImportError:
+        json_loads = json.loads
+
+        def json_dumps(obj):
+            return json.dumps(obj, separators=(',', ':'))
+
+def atomic_write_json(path, obj):
+    # Write-then-rename so a crash mid-write can't corrupt the file.
+    tmp = path.with_suffix('.tmp')
+    tmp.write_text(json_dumps(obj))
+    os.replace(tmp, path)
+
+# Passcodes (salted PBKDF2; factory defaults are seeded on first launch)
+PASSCODES_FILE = BASE_DIR / "passcodes.json"
+PBKDF2_ITERATIONS = 200_000
+DEFAULT_PASSCODES = {"admin": "1984", "master": "1776"}
+
+def derive_passcode(pin, salt):
+    return hashlib.pbkdf2_hmac('sha256', pin.encode(), salt, PBKDF2_ITERATIONS)
+
+def load_passcodes():
+    if not PASSCODES_FILE.exists():
+        salt = os.urandom(16)
+        codes = {"salt": salt.hex()}
+        for name, pin in DEFAULT_PASSCODES.items():
+            codes[name] = derive_passcode(pin, salt).hex()
+        atomic_write_json(PASSCODES_FILE, codes)
+        return codes
+    return JSON_CACHE.get(PASSCODES_FILE)
+
+# Recent entries storage (cached in memory, invalidated by file mtime)
+_RECENT_CACHE = {"mtime": 0, "data": None}
 
-# Recent entries storage
 def load_recent_entries():
-    if RECENT_ENTRIES_FILE.exists():
-        with open(RECENT_ENTRIES_FILE, 'r') as f:
-            return json.load(f)
-    return {}
+    try:
+        mtime = os.stat(RECENT_ENTRIES_FILE).st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    if _RECENT_CACHE["data"] is None or _RECENT_CACHE["mtime"] != mtime:
+        _RECENT_CACHE["data"] = json_loads(RECENT_ENTRIES_FILE.read_bytes())
+        _RECENT_CACHE["mtime"] = mtime
+    return _RECENT_CACHE["data"]
 
 def save_recent_entry(field, value):
     recent = load_recent_entries()
@@ -50,8 +102,97 @@ def save_recent_entry(field, value):
     if value and value not in recent[field]:
         recent[field].insert(0, value)
         recent[field] = recent[field][:5]
-        with open(RECENT_ENTRIES_FILE, 'w') as f:
-            json.dump(recent, f)
+        atomic_write_json(RECENT_ENTRIES_FILE, recent)
+        _RECENT_CACHE["data"] = recent
+        _RECENT_CACHE["mtime"] = os.stat(RECENT_ENTRIES_FILE).st_mtime_ns
+
+# Parsed-JSON file cache, invalidated by (mtime, size)
+class JsonFileCache:
+    def __init__(self):
+        self._entries = {}
+
+    def get(self, path):
+        st = os.stat(path)
+        key = (st.st_mtime_ns, st.st_size)
+        entry = self._entries.get(path)
+        if entry and entry[0] == key:
+            return entry[1]
+        obj = json_loads(path.read_bytes())
+        self._entries[path] = (key, obj)
+        return obj
+
+JSON_CACHE = JsonFileCache()
+
+# Directory listing cache, invalidated by the directory's mtime
+class DirManifest:
+    def __init__(self):
+        self._cache = {}
+
+    def list(self, directory, pattern):
+        mtime = os.stat(directory).st_mtime_ns
+        entry = self._cache.get((directory, pattern))
+        if entry and entry[0] == mtime:
+            return entry[1]
+        if pattern.startswith('*') and '*' not in pattern[1:]:
+            # Plain suffix match: os.scandir reuses the directory entry's
+            # stat instead of pathlib.glob's per-file stat calls.
+            suffix = pattern[1:]
+            with os.scandir(directory) as it:
+                paths = [Path(e.path) for e in it if e.name.endswith(suffix)]
+        else:
+            paths = list(directory.glob(pattern))
+        self._cache[(directory, pattern)] = (mtime, paths)
+        return paths
+
+DIR_MANIFEST = DirManifest()
+
+def _curve_path(name):
+    return CURVES_DIR / f"{name}.json"
+
+STATUS_RANK = {"Incomplete": 0, "Pending": 1, "Complete": 2}
+
+# Form-age thresholds in seconds
+SEC_24H = 24 * 3600
+SEC_3D = 3 * SEC_24H
+SEC_WEEK = 7 * SEC_24H
+
+# Display labels for JSON field names, precomputed once
+FIELD_LABELS = {
+    "soil_type": "Soil Type",
+    "source": "Source",
+    "sample_id": "Sample Id",
+    "ngi": "Ngi",
+    "target_dtv": "Target Dtv",
+    "optimum_moisture": "Optimum Moisture",
+    "moisture_limits": "Moisture Limits",
+    "notes": "Notes",
+    "station": "Station",
+    "feet_cl": "Feet Cl",
+    "depth": "Depth",
+    "canister": "Canister",
+    "test_method": "Test Method",
+    "wet_weight": "Wet Weight",
+    "intermediate_weights": "Intermediate Weights",
+    "dry_weight": "Dry Weight",
+    "loss": "Loss",
+    "moisture_content": "Moisture Content",
+    "result": "Result",
+}
+
+# Recycled list row: rebinds text/color on scroll instead of rebuilding widgets
+class FormRow(RecycleDataViewBehavior, Label):
+    def refresh_view_attrs(self, rv, index, data):
+        self.index = index
+        return super().refresh_view_attrs(rv, index, data)
+
+class RowsView(RecycleView):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.viewclass = 'FormRow'
+        lm = RecycleBoxLayout(orientation='vertical', default_size=(None, 40),
+                              default_size_hint=(1, None), size_hint_y=None)
+        lm.bind(minimum_height=lm.setter('height'))
+        self.add_widget(lm)
 
 # Auto-complete TextInput
 class AutoCompleteTextInput(TextInput):
@@ -125,30 +266,39 @@ class HomeScreen(Screen):
         Popup(title="Passcode", content=content, size_hint=(0.5, 0.5)).open()
 
     def verify_passcode(self, passcode, target):
-        if hashlib.sha256(passcode.encode()).hexdigest() == ADMIN_PASSCODE_HASH:
-            self.manager.current = target
-        elif target == 'change_passcode' and hashlib.sha256(passcode.encode()).hexdigest() == MASTER_PASSCODE_HASH:
+        codes = load_passcodes()
+        digest = derive_passcode(passcode, bytes.fromhex(codes['salt']))
+        if target == 'change_passcode' and hmac.compare_digest(digest, bytes.fromhex(codes['master'])):
             self.show_change_passcode_popup()
+        elif hmac.compare_digest(digest, bytes.fromhex(codes['admin'])):
+            self.manager.current = target
         else:
             Popup(title="Error", content=Label(text="Invalid Passcode"), size_hint=(0.5, 0.3)).open()
 
     def save_general_info(self):
-        info = {
+        # Read-modify-write so keys owned elsewhere (form_counters) survive.
+        try:
+            info = json_loads(GENERAL_INFO_FILE.read_bytes())
+        except FileNotFoundError:
+            info = {}
+        info.update({
             "inspector_name": self.inspector_name.text,
             "inspector_initials": self.inspector_initials.text,
             "district": self.district.text,
             "date": self.date
-        }
-        with open(GENERAL_INFO_FILE, 'w') as f:
-            json.dump(info, f)
+        })
+        atomic_write_json(GENERAL_INFO_FILE, info)
         
 # Curves Screen
 class CurvesScreen(Screen):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         layout = BoxLayout(orientation='vertical')
-        self.rv = RecycleView()
+        self.rv = RowsView()
         self.rv.data = []
+        self._all_rows = []
+        self._last_term = ""
+        self._search_ev = None
         layout.add_widget(TextInput(hint_text="Search", on_text=self.search))
         layout.add_widget(self.rv)
         layout.add_widget(Button(text="Home", on_press=self.go_home))
@@ -159,25 +309,41 @@ class CurvesScreen(Screen):
         self.manager.current = 'home'
 
     def load_curves(self):
-        self.rv.data = [
-            {"text": f"{c['name']} | {c['source']} | {c['sample_id']} | {c['ngi']}", "curve": c}
-            for c in [json.load(open(f)) for f in CURVES_DIR.glob("*.json")]
-        ]
+        rows = []
+        for c in [JSON_CACHE.get(f) for f in DIR_MANIFEST.list(CURVES_DIR, "*.json")]:
+            text = f"{c['name']} | {c['source']} | {c['sample_id']} | {c['ngi']}"
+            rows.append({"text": text, "text_lower": text.lower(), "name": c['name']})
+        self._all_rows = rows
+        self._last_term = ""
+        self.rv.data = rows
 
     def search(self, instance):
-        term = instance.text.lower()
-        self.rv.data = [
-            d for d in self.load_curves.__self__.rv.data
-            if term in d["text"].lower()
-        ]
+        # Coalesce burst typing into one filter pass.
+        if self._search_ev:
+            self._search_ev.cancel()
+        self._search_ev = Clock.schedule_once(lambda dt, t=instance.text: self._do_search(t), 0.12)
+
+    def _do_search(self, text):
+        self._search_ev = None
+        term = text.lower()
+        if not term:
+            self.rv.data = self._all_rows
+        else:
+            # Narrowing a previous term only needs to re-filter what is shown.
+            base = self.rv.data if self._last_term and term.startswith(self._last_term) else self._all_rows
+            self.rv.data = [d for d in base if term in d["text_lower"]]
+        self._last_term = term
 
 # Forms Screen
 class FormsScreen(Screen):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         layout = BoxLayout(orientation='vertical')
-        self.rv = RecycleView()
+        self.rv = RowsView()
         self.rv.data = []
+        self._all_rows = []
+        self._last_term = ""
+        self._search_ev = None
         layout.add_widget(TextInput(hint_text="Search by ID/Name/Date", on_text=self.search))
         layout.add_widget(self.rv)
         layout.add_widget(Button(text="Create New Form", on_press=self.create_form))
@@ -191,44 +357,64 @@ class FormsScreen(Screen):
 
     def load_forms(self):
         forms = []
-        for f in FORMS_DIR.glob("*.json"):
-            form = json.load(open(f))
-            last_update = datetime.fromisoformat(form['last_update'])
-            age = datetime.now() - last_update
+        now = time.time()
+        for f in DIR_MANIFEST.list(FORMS_DIR, "*.json"):
+            form = JSON_CACHE.get(f)
+            epoch = form.get('last_update_epoch')
+            if epoch is None:  # forms written before the epoch field existed
+                epoch = datetime.fromisoformat(form['last_update']).timestamp()
+            age = now - epoch
             color = "#FFFFFF"
             if form['status'] == "Incomplete":
-                if age > timedelta(weeks=1):
+                if age > SEC_WEEK:
                     color = "#FF0000"
-                elif age > timedelta(days=3):
+                elif age > SEC_3D:
                     color = "#FFA500"
-                elif age > timedelta(hours=24):
+                elif age > SEC_24H:
                     color = "#FFFF00"
+            text = f"{form['form_id']} | {form['status']} | {form['inspector_name']} | {form['date']}"
             forms.append({
-                "text": f"{form['form_id']} | {form['status']} | {form['inspector_name']} | {form['date']}",
-                "form": form,
-                "color": color
+                "text": text,
+                "text_lower": text.lower(),
+                "form_id": form['form_id'],
+                "color": color,
+                "_sort": (STATUS_RANK[form['status']], form['date'])
             })
-        forms.sort(key=lambda x: (
-            {"Incomplete": 0, "Pending": 1, "Complete": 2}[x["form"]["status"]],
-            x["form"]["date"]
-        ))
+        forms.sort(key=operator.itemgetter("_sort"))
+        self._all_rows = forms
+        self._last_term = ""
         self.rv.data = forms
 
     def search(self, instance):
-        term = instance.text.lower()
-        self.rv.data = [
-            d for d in self.load_forms.__self__.rv.data
-            if term in d["text"].lower()
-        ]
+        # Coalesce burst typing into one filter pass.
+        if self._search_ev:
+            self._search_ev.cancel()
+        self._search_ev = Clock.schedule_once(lambda dt, t=instance.text: self._do_search(t), 0.12)
+
+    def _do_search(self, text):
+        self._search_ev = None
+        term = text.lower()
+        if not term:
+            self.rv.data = self._all_rows
+        else:
+            # Narrowing a previous term only needs to re-filter what is shown.
+            base = self.rv.data if self._last_term and term.startswith(self._last_term) else self._all_rows
+            self.rv.data = [d for d in base if term in d["text_lower"]]
+        self._last_term = term
 
     def create_form(self, instance=None):
-        info = json.load(open(GENERAL_INFO_FILE))
-        counter = len(list(FORMS_DIR.glob(f"F{info['inspector_initials']}*.json"))) + 1
-        form_id = f"F{info['inspector_initials']}{datetime.now().strftime('%Y%m%d_%H%M')}_{counter}"
+        info = json_loads(GENERAL_INFO_FILE.read_bytes())
+        initials = info['inspector_initials']
+        counters = info.setdefault('form_counters', {})
+        counter = counters.get(initials, 0) + 1
+        counters[initials] = counter
+        atomic_write_json(GENERAL_INFO_FILE, info)
+        form_id = f"F{initials}{datetime.now().strftime('%Y%m%d_%H%M')}_{counter}"
         form = {
             "form_id": form_id,
             "date": datetime.now().isoformat(),
             "last_update": datetime.now().isoformat(),
+            "last_update_epoch": int(time.time()),
             "inspector_name": info["inspector_name"],
             "project_no": "",
             "contract_no": "",
@@ -242,8 +428,7 @@ class FormsScreen(Screen):
         }
         form_dir = FORMS_DIR / form_id
         form_dir.mkdir(exist_ok=True)
-        with open(form_dir / "form.json", 'w') as f:
-            json.dump(form, f)
+        atomic_write_json(form_dir / "form.json", form)
         self.manager.get_screen('form').load_form(form_id)
         self.manager.current = 'form'
 
@@ -260,19 +445,19 @@ class FormScreen(Screen):
     def load_form(self, form_id):
         self.layout.clear_widgets()
         form_path = FORMS_DIR / form_id / "form.json"
-        self.form = json.load(open(form_path))
+        self.form = JSON_CACHE.get(form_path)
         self.layout.add_widget(Label(text=f"Form ID: {self.form['form_id']}"))
         self.layout.add_widget(Label(text=f"Date: {self.form['date']}"))
         self.inspector_name = AutoCompleteTextInput("inspector_name", text=self.form['inspector_name'])
         self.project_no = AutoCompleteTextInput("project_no", text=self.form['project_no'])
         self.contract_no = AutoCompleteTextInput("contract_no", text=self.form['contract_no'])
-        self.curve_name = Spinner(values=[c.stem for c in CURVES_DIR.glob("*.json")])
+        self.curve_name = Spinner(values=[c.stem for c in DIR_MANIFEST.list(CURVES_DIR, "*.json")])
         self.curve_name.bind(text=self.load_curve_data)
         for w in [self.inspector_name, self.project_no, self.contract_no, self.curve_name]:
             self.layout.add_widget(w)
         self.curve_data_labels = {}
         for field in ["soil_type", "source", "sample_id", "ngi", "target_dtv", "optimum_moisture", "moisture_limits", "notes"]:
-            self.curve_data_labels[field] = Label(text=f"{field.replace('_', ' ').title()}:")
+            self.curve_data_labels[field] = Label(text=f"{FIELD_LABELS[field]}:")
             self.layout.add_widget(self.curve_data_labels[field])
         self.layout.add_widget(Label(text=f"Moisture Result: {self.form['moisture_result']}"))
         self.layout.add_widget(Label(text=f"Deflection Result: {self.form['deflection_result']}"))
@@ -306,18 +491,22 @@ class MoistureTestScreen(Screen):
     def load_test(self, form_id):
         self.form_id = form_id
         self.layout.clear_widgets()
-        curve = json.load(open(CURVES_DIR / json.load(open(FORMS_DIR / form_id / "form.json"))['curve_name'] + ".json"))
+        form = JSON_CACHE.get(FORMS_DIR / form_id / "form.json")
+        try:
+            curve = JSON_CACHE.get(_curve_path(form['curve_name'])) if form['curve_name'] else {}
+        except FileNotFoundError:  # curve deleted or archived
+            curve = {}
         self.test_id = f"T{form_id[1:]}_M"
         self.layout.add_widget(Label(text=f"Test ID: {self.test_id}"))
         for field in ["soil_type", "source", "optimum_moisture", "moisture_limits"]:
-            self.layout.add_widget(Label(text=f"{field.replace('_', ' ').title()}: {curve[field]}"))
+            self.layout.add_widget(Label(text=f"{FIELD_LABELS[field]}: {curve.get(field, '')}"))
         self.station = AutoCompleteTextInput("station")
         self.feet_cl = AutoCompleteTextInput("feet_cl")
         self.depth = TextInput(hint_text="Depth Below Finish Grade")
         self.canister = TextInput(hint_text="Canister #")
         self.test_method = Spinner(values=["Oven", "Stove", "Speedy"])
         self.wet_weight = TextInput(hint_text="Wet Weight (g)")
-        self.intermediate_weights = [TextInput(hint_text=f"Intermediate Weight {i+1} (g)") for i in range(8)]
+        self.intermediate_weights = [None] * 8
         self.dry_weight = TextInput(hint_text="Dry Weight (g)")
         self.loss = Label(text="Loss: ")
         self.moisture_content = Label(text="Moisture Content: ")
@@ -325,10 +514,7 @@ class MoistureTestScreen(Screen):
         self.notes = TextInput(hint_text="Notes")
         for w in [self.station, self.feet_cl, self.depth, self.canister, self.test_method, self.wet_weight]:
             self.layout.add_widget(w)
-        for i, w in enumerate(self.intermediate_weights):
-            w.bind(text=lambda x, v, i=i: self.show_next_intermediate(i))
-            if i == 0:
-                self.layout.add_widget(w)
+        self.layout.add_widget(self._make_intermediate(0))
         self.layout.add_widget(self.dry_weight)
         self.layout.add_widget(self.loss)
         self.layout.add_widget(self.moisture_content)
@@ -340,10 +526,16 @@ class MoistureTestScreen(Screen):
         self.wet_weight.bind(text=self.calculate)
         self.dry_weight.bind(text=self.calculate)
 
+    def _make_intermediate(self, index):
+        w = TextInput(hint_text=f"Intermediate Weight {index+1} (g)")
+        w.bind(text=lambda x, v, i=index: self.show_next_intermediate(i))
+        self.intermediate_weights[index] = w
+        return w
+
     def show_next_intermediate(self, index):
         if self.intermediate_weights[index].text and index < 7:
-            if self.intermediate_weights[index + 1] not in self.layout.children:
-                self.layout.add_widget(self.intermediate_weights[index + 1], index=4)
+            if self.intermediate_weights[index + 1] is None:
+                self.layout.add_widget(self._make_intermediate(index + 1), index=4)
 
     def calculate(self, *args):
         try:
@@ -353,11 +545,12 @@ class MoistureTestScreen(Screen):
             self.loss.text = f"Loss: {loss:.2f} g"
             content = (loss / wet) * 100
             self.moisture_content.text = f"Moisture Content: {content:.2f}%"
-            curve = json.load(open(CURVES_DIR / json.load(open(FORMS_DIR / self.form_id / "form.json"))['curve_name'] + ".json"))
+            form = JSON_CACHE.get(FORMS_DIR / self.form_id / "form.json")
+            curve = JSON_CACHE.get(_curve_path(form['curve_name']))
             opt = curve["optimum_moisture"]
             lim = curve["moisture_limits"]
             self.result.text = f"Result: {'PASS' if opt + lim[0] <= content <= opt + lim[1] else 'FAIL'}"
-        except (ValueError, TypeError):
+        except (ValueError, TypeError, FileNotFoundError, KeyError):
             pass
 
     def submit(self, instance):
@@ -373,25 +566,26 @@ class MoistureTestScreen(Screen):
             "canister": self.canister.text,
             "test_method": self.test_method.text,
             "wet_weight": self.wet_weight.text,
-            "intermediate_weights": [w.text for w in self.intermediate_weights if w.text],
+            "intermediate_weights": [w.text for w in self.intermediate_weights if w and w.text],
             "dry_weight": self.dry_weight.text,
             "loss": self.loss.text,
             "moisture_content": self.moisture_content.text,
             "result": self.result.text.split(": ")[1],
             "notes": self.notes.text
         }
-        form = json.load(open(FORMS_DIR / self.form_id / "form.json"))
+        form = json_loads((FORMS_DIR / self.form_id / "form.json").read_bytes())
         form['tests'].append(test)
         form['moisture_result'] = test['result']
         form['overall_result'] = "PASS" if all(t['result'] == "PASS" for t in form['tests']) else "FAIL"
         form['status'] = "Pending" if len(form['tests']) == 2 else "Incomplete"
         form['last_update'] = datetime.now().isoformat()
-        with open(FORMS_DIR / self.form_id / "form.json", 'w') as f:
-            json.dump(form, f)
+        form['last_update_epoch'] = int(time.time())
+        atomic_write_json(FORMS_DIR / self.form_id / "form.json", form)
         test_dir = FORMS_DIR / self.form_id / "Tests"
         test_dir.mkdir(exist_ok=True)
-        with open(test_dir / f"{self.test_id}.json", 'w') as f:
-            json.dump(test, f)
+        atomic_write_json(test_dir / f"{self.test_id}.json", test)
+        if hasattr(os, 'sync'):
+            os.sync()  # one flush cycle for both files
         for field in ["station", "feet_cl", "canister"]:
             save_recent_entry(field, getattr(self, field).text)
         self.manager.current = 'form'
@@ -401,8 +595,11 @@ class AdminScreen(Screen):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         layout = BoxLayout(orientation='vertical')
-        self.rv = RecycleView()
+        self.rv = RowsView()
         self.rv.data = []
+        self._all_rows = []
+        self._last_term = ""
+        self._search_ev = None
         layout.add_widget(TextInput(hint_text="Search", on_text=self.search))
         layout.add_widget(self.rv)
         layout.add_widget(Button(text="Add New Curve", on_press=self.go_add_curve))
@@ -419,13 +616,16 @@ class AdminScreen(Screen):
         self.manager.current = 'home'
 
     def load_curves(self):
-        self.rv.data = [
-            {"text": f"{c['name']} | {c['source']} | {c['sample_id']} | {c['ngi']}", "curve": c}
-            for c in [json.load(open(f)) for f in CURVES_DIR.glob("*.json")]
-        ]
+        rows = []
+        for c in [JSON_CACHE.get(f) for f in DIR_MANIFEST.list(CURVES_DIR, "*.json")]:
+            text = f"{c['name']} | {c['source']} | {c['sample_id']} | {c['ngi']}"
+            rows.append({"text": text, "text_lower": text.lower(), "name": c['name']})
+        self._all_rows = rows
+        self._last_term = ""
+        self.rv.data = rows
 
     def archive_curve(self, instance):
-        selected = [d['curve'] for d in self.rv.data if d.get('selected')]
+        selected = [d['name'] for d in self.rv.data if d.get('selected')]
         if not selected:
             return
         content = BoxLayout(orientation='vertical')
@@ -433,9 +633,9 @@ class AdminScreen(Screen):
         content.add_widget(Button(text="Yes", on_press=lambda x: self.do_archive_curve(selected)))
         Popup(title="Archive Curve", content=content, size_hint=(0.5, 0.3)).open()
 
-    def do_archive_curve(self, curves):
-        for curve in curves:
-            os.rename(CURVES_DIR / f"{curve['name']}.json", ARCHIVED_CURVES_DIR / f"{curve['name']}.json")
+    def do_archive_curve(self, names):
+        for name in names:
+            os.rename(_curve_path(name), ARCHIVED_CURVES_DIR / f"{name}.json")
         self.load_curves()
 
 # Add Curve Screen
@@ -477,23 +677,31 @@ class ArchiveScreen(Screen):
 # Archived Curves Screen
 class ArchivedCurvesScreen(CurvesScreen):
     def load_curves(self):
-        self.rv.data = [
-            {"text": f"{c['name']} | {c['source']} | {c['sample_id']} | {c['ngi']}", "curve": c}
-            for c in [json.load(open(f)) for f in ARCHIVED_CURVES_DIR.glob("*.json")]
-        ]
+        rows = []
+        for c in [JSON_CACHE.get(f) for f in DIR_MANIFEST.list(ARCHIVED_CURVES_DIR, "*.json")]:
+            text = f"{c['name']} | {c['source']} | {c['sample_id']} | {c['ngi']}"
+            rows.append({"text": text, "text_lower": text.lower(), "name": c['name']})
+        self._all_rows = rows
+        self._last_term = ""
+        self.rv.data = rows
 
 # Archived Forms Screen
 class ArchivedFormsScreen(FormsScreen):
     def load_forms(self):
         forms = []
-        for f in ARCHIVED_FORMS_DIR.glob("*.json"):
-            form = json.load(open(f))
+        for f in DIR_MANIFEST.list(ARCHIVED_FORMS_DIR, "*.json"):
+            form = JSON_CACHE.get(f)
+            text = f"{form['form_id']} | {form['status']} | {form['inspector_name']} | {form['date']}"
             forms.append({
-                "text": f"{form['form_id']} | {form['status']} | {form['inspector_name']} | {form['date']}",
-                "form": form,
-                "color": "#FFFFFF"
+                "text": text,
+                "text_lower": text.lower(),
+                "form_id": form['form_id'],
+                "color": "#FFFFFF",
+                "_sort": form['date']
             })
-        forms.sort(key=lambda x: x["form"]["date"])
+        forms.sort(key=operator.itemgetter("_sort"))
+        self._all_rows = forms
+        self._last_term = ""
         self.rv.data = forms
 
     def create_form(self, instance=None):
@@ -502,38 +710,46 @@ class ArchivedFormsScreen(FormsScreen):
     def archive_forms(self, instance):
         pass  # No archiving in archive
 
-# PDF Generation
+# PDF Generation (static page setup built once and shared across forms)
+_PDF_TEMPLATE = {}
+
+def _pdf_template():
+    if not _PDF_TEMPLATE:
+        styles = getSampleStyleSheet()
+        body = styles['Normal']
+        _PDF_TEMPLATE['body'] = body
+        _PDF_TEMPLATE['indent'] = ParagraphStyle('Indent', parent=body, leftIndent=20)
+        frame = Frame(72, 72, letter[0] - 144, letter[1] - 144, id='body')
+        _PDF_TEMPLATE['page'] = PageTemplate(id='form', frames=[frame])
+    return _PDF_TEMPLATE
+
 def generate_pdf(form_id):
-    form = json.load(open(FORMS_DIR / form_id / "form.json"))
-    curve = json.load(open(CURVES_DIR / f"{form['curve_name']}.json"))
+    form = JSON_CACHE.get(FORMS_DIR / form_id / "form.json")
+    curve = JSON_CACHE.get(_curve_path(form['curve_name']))
     pdf_path = BASE_DIR / f"{form_id}.pdf"
-    c = canvas.Canvas(str(pdf_path), pagesize=letter)
-    c.drawString(100, 750, f"Form ID: {form['form_id']}")
-    c.drawString(100, 730, f"Date: {form['date']}")
-    c.drawString(100, 710, f"Inspector: {form['inspector_name']}")
-    c.drawString(100, 690, f"Project #: {form['project_no']}")
-    c.drawString(100, 670, f"Contract #: {form['contract_no']}")
-    c.drawString(100, 650, f"Curve: {form['curve_name']}")
-    y = 630
+    tmpl = _pdf_template()
+    body, indent = tmpl['body'], tmpl['indent']
+    story = [
+        Paragraph(f"Form ID: {form['form_id']}", body),
+        Paragraph(f"Date: {form['date']}", body),
+        Paragraph(f"Inspector: {form['inspector_name']}", body),
+        Paragraph(f"Project #: {form['project_no']}", body),
+        Paragraph(f"Contract #: {form['contract_no']}", body),
+        Paragraph(f"Curve: {form['curve_name']}", body),
+    ]
     for field in ["soil_type", "source", "sample_id", "ngi", "target_dtv", "optimum_moisture", "moisture_limits"]:
-        c.drawString(100, y, f"{field.replace('_', ' ').title()}: {curve[field]}")
-        y -= 20
-    c.drawString(100, y, f"Moisture Result: {form['moisture_result']}")
-    y -= 20
-    c.drawString(100, y, f"Deflection Result: {form['deflection_result']}")
-    y -= 20
-    c.drawString(100, y, f"Overall Result: {form['overall_result']}")
-    y -= 20
-    c.drawString(100, y, f"Status: {form['status']}")
-    y -= 20
+        story.append(Paragraph(f"{FIELD_LABELS[field]}: {curve[field]}", body))
+    story.append(Paragraph(f"Moisture Result: {form['moisture_result']}", body))
+    story.append(Paragraph(f"Deflection Result: {form['deflection_result']}", body))
+    story.append(Paragraph(f"Overall Result: {form['overall_result']}", body))
+    story.append(Paragraph(f"Status: {form['status']}", body))
     for test in form['tests']:
-        c.drawString(100, y, f"Test: {test['test_id']} ({test['type']})")
-        y -= 20
+        story.append(Paragraph(f"Test: {test['test_id']} ({test['type']})", body))
         for key, value in test.items():
             if key not in ['type', 'test_id']:
-                c.drawString(120, y, f"{key.replace('_', ' ').title()}: {value}")
-                y -= 20
-    c.save()
+                story.append(Paragraph(f"{FIELD_LABELS.get(key, key)}: {value}", indent))
+    doc = BaseDocTemplate(str(pdf_path), pagesize=letter, pageTemplates=[tmpl['page']])
+    doc.build(story)
     return pdf_path
 
 # Run App